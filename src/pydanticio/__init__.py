@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import BinaryIO, Literal
 
@@ -28,6 +28,7 @@ try:
 except ImportError:
     from .backends import cbor_stub as cbor_backend
 
+from .interning import StringInterner, validate_rows
 from .version import __version__
 
 GenericDataFormat = Literal["json", "yaml", "messagepack", "cbor"]
@@ -94,21 +95,27 @@ def read_records_from_reader[T: BaseModel](
     reader: BinaryIO,
     model: type[T],
     data_format: GenericDataFormat | LinesOnlyDataFormat,
+    interner: StringInterner | None = None,
 ) -> list[T]:
     list_model = RootModel[list[model]]
     match data_format:
         case "csv":
-            return csv_backend.read_records(reader, model)
+            return csv_backend.read_records(reader, model, interner)
         case "json_lines":
-            return jsl_backend.read_records(reader, model)
+            return jsl_backend.read_records(reader, model, interner)
         case "json":
-            return json_backend.read_record(reader, list_model).root
+            records = json_backend.read_record(reader, list_model).root
+            if interner is not None:
+                records = [interner.intern_record(record) for record in records]
+            return records
+        case "yaml" if interner is not None:
+            return validate_rows(yaml_backend.read_raw_records(reader), model, interner)
         case "yaml":
             return yaml_backend.read_record(reader, list_model).root
         case "messagepack":
-            return messagepack_backend.read_records(reader, model)
+            return messagepack_backend.read_records(reader, model, interner)
         case "cbor":
-            return cbor_backend.read_records(reader, model)
+            return cbor_backend.read_records(reader, model, interner)
         case _:
             raise ValueError(f"Unsupported backend type: {data_format}")
 
@@ -117,6 +124,7 @@ def read_records_from_file[T: BaseModel](
     file_path: str | Path,
     model: type[T],
     data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+    interner: StringInterner | None = None,
 ) -> list[T]:
     file_path = Path(file_path)
     actual_data_format = data_format or decide_data_format_from_path(file_path)
@@ -125,7 +133,41 @@ def read_records_from_file[T: BaseModel](
             f"Data format {actual_data_format} is not supported for multiple record reading"
         )
     with file_path.open("rb") as reader:
-        return read_records_from_reader(reader, model, actual_data_format)
+        return read_records_from_reader(reader, model, actual_data_format, interner)
+
+
+def iter_records_from_reader[T: BaseModel](
+    reader: BinaryIO,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat,
+) -> Iterator[T]:
+    match data_format:
+        case "csv":
+            yield from csv_backend.iter_records(reader, model)
+        case "json_lines":
+            yield from jsl_backend.iter_records(reader, model)
+        case "messagepack":
+            yield from messagepack_backend.iter_records(reader, model)
+        case "json" | "yaml" | "cbor":
+            # These formats are decoded as a whole before the first record is available
+            yield from read_records_from_reader(reader, model, data_format)
+        case _:
+            raise ValueError(f"Unsupported backend type: {data_format}")
+
+
+def iter_records_from_file[T: BaseModel](
+    file_path: str | Path,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+) -> Iterator[T]:
+    file_path = Path(file_path)
+    actual_data_format = data_format or decide_data_format_from_path(file_path)
+    if actual_data_format in ("toml",):
+        raise ValueError(
+            f"Data format {actual_data_format} is not supported for multiple record reading"
+        )
+    with file_path.open("rb") as reader:
+        yield from iter_records_from_reader(reader, model, actual_data_format)
 
 
 def write_record_to_writer(
@@ -166,21 +208,19 @@ def write_records_to_writer[T: BaseModel](
     records: Iterable[T],
     data_format: GenericDataFormat | LinesOnlyDataFormat,
 ) -> None:
-    list_model = RootModel[Iterable[T]]
-
     match data_format:
         case "csv":
             csv_backend.write_records(writer, records)
         case "json_lines":
             jsl_backend.write_records(writer, records)
         case "json":
-            json_backend.write_record(writer, list_model(root=records))
+            json_backend.write_records(writer, records)
         case "yaml":
-            yaml_backend.write_record(writer, list_model(root=records))
+            yaml_backend.write_records(writer, records)
         case "messagepack":
-            messagepack_backend.write_records(writer, list(records))
+            messagepack_backend.write_records(writer, records)
         case "cbor":
-            cbor_backend.write_records(writer, list(records))
+            cbor_backend.write_records(writer, records)
         case _:
             raise ValueError(f"Unsupported backend type: {data_format}")
 
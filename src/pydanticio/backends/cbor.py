@@ -1,8 +1,13 @@
-from typing import BinaryIO
+from collections.abc import Iterable
+from io import BytesIO
+from typing import Any, BinaryIO
 
 import cbor2
 from pydantic import BaseModel
 
+from ..interning import StringInterner, validate_rows
+from ..utils import write_length_prefixed_array
+
 
 def read_record[T: BaseModel](reader: BinaryIO, model: type[T]) -> T:
     data = reader.read()
@@ -15,12 +20,29 @@ def write_record(writer: BinaryIO, record: BaseModel) -> None:
     writer.write(data)  # type: ignore
 
 
-def read_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> list[T]:
+def read_records[T: BaseModel](
+    reader: BinaryIO, model: type[T], interner: StringInterner | None = None
+) -> list[T]:
     data = reader.read()
     unpacked = cbor2.loads(data)
-    return [model.model_validate(item) for item in unpacked]
+    return validate_rows(unpacked, model, interner)
 
 
-def write_records[T: BaseModel](writer: BinaryIO, records: list[T]) -> None:
-    data = cbor2.dumps([record.model_dump(mode="json") for record in records], canonical=True)
-    writer.write(data)  # type: ignore
+def _encode_array_header(length: int) -> bytes:
+    buffer = BytesIO()
+    cbor2.CBOREncoder(buffer, canonical=True).encode_length(4, length)
+    return buffer.getvalue()
+
+
+def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
+    write_length_prefixed_array(
+        writer,
+        records,
+        _encode_array_header,
+        lambda record: cbor2.dumps(record.model_dump(mode="json"), canonical=True),
+    )
+
+
+def read_raw_records(reader: BinaryIO) -> list[Any]:
+    data = reader.read()
+    return cbor2.loads(data)
@@ -1,16 +1,150 @@
 import csv
-from collections.abc import Iterable
-from typing import BinaryIO
+import types
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import cache
+from operator import itemgetter
+from typing import Any, BinaryIO, Union, get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
 
+from ..interning import StringInterner, validate_rows
 from ..utils import managed_text_io
 
+type _Path = tuple[str, ...]
 
-def read_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> list[T]:
+
+def _nested_model(annotation: Any) -> tuple[type[BaseModel] | None, bool]:
+    # Returns the model a field holds and whether the field is optional (`Model | None`)
+    optional = False
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None, False
+        annotation, optional = args[0], True
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and not issubclass(annotation, RootModel)
+    ):
+        return annotation, optional
+    return None, False
+
+
+def _flatten_fields(
+    model: type[BaseModel],
+    prefix: _Path = (),
+    optional_paths: list[_Path] | None = None,
+    parents: tuple[type[BaseModel], ...] = (),
+) -> list[_Path]:
+    # Nested models are flattened into dotted columns, e.g. `address.city`.
+    # Root models are written as their root value, and recursive models are not expanded.
+    paths: list[_Path] = []
+    for name, field in model.model_fields.items():
+        nested, optional = _nested_model(field.annotation)
+        if nested is None or nested in (*parents, model):
+            paths.append((*prefix, name))
+            continue
+        if optional and optional_paths is not None:
+            optional_paths.append((*prefix, name))
+        paths.extend(_flatten_fields(nested, (*prefix, name), optional_paths, (*parents, model)))
+    return paths
+
+
+def _get_path(data: Any, path: _Path) -> Any:
+    for key in path:
+        if data is None:
+            # A missing optional nested model is written as empty columns
+            return None
+        # Fields excluded from dumps are written as empty columns, like csv.DictWriter does
+        data = data.get(key)
+    return data
+
+
+def _is_empty(data: Any) -> bool:
+    if isinstance(data, dict):
+        return all(_is_empty(value) for value in data.values())
+    return data is None or data == ""
+
+
+class _RowCodec:
+    def __init__(self, model: type[BaseModel]) -> None:
+        optional_paths: list[_Path] = []
+        self.paths = _flatten_fields(model, optional_paths=optional_paths)
+        # Deepest first, so that an emptied inner model counts as empty for its parent
+        self._optional_paths = sorted(optional_paths, key=len, reverse=True)
+        self.columns = [".".join(path) for path in self.paths]
+        self._path_by_column = dict(zip(self.columns, self.paths, strict=True))
+        self._encode_dump: Callable[[dict[str, Any]], Sequence[Any]]
+        if len(self.columns) > 1 and all(len(path) == 1 for path in self.paths):
+            # A single itemgetter call picks all values of a flat model in column order
+            self._encode_dump = itemgetter(*self.columns)
+        else:
+            self._encode_dump = lambda dump: [_get_path(dump, path) for path in self.paths]
+
+    def encode(self, record: BaseModel) -> Sequence[Any]:
+        dump = record.model_dump(mode="json")
+        try:
+            return self._encode_dump(dump)
+        except KeyError:
+            return [_get_path(dump, path) for path in self.paths]
+
+    def decoder(self, header: Sequence[str]) -> Callable[[Sequence[str]], dict[str, Any]]:
+        # Columns that don't belong to a nested model are passed through as-is
+        paths = [self._path_by_column.get(column, (column,)) for column in header]
+        if all(len(path) == 1 for path in paths):
+            keys = list(header)
+            return lambda row: dict(zip(keys, row, strict=False))
+
+        def decode(row: Sequence[str]) -> dict[str, Any]:
+            data: dict[str, Any] = {}
+            for path, value in zip(paths, row, strict=False):
+                target = data
+                for key in path[:-1]:
+                    target = target.setdefault(key, {})
+                target[path[-1]] = value
+            # None and a nested model whose fields are all empty are written the same
+            # way, so the latter is also read back as None
+            for path in self._optional_paths:
+                parent = _get_path(data, path[:-1])
+                if isinstance(parent, dict) and _is_empty(parent.get(path[-1])):
+                    parent[path[-1]] = None
+            return data
+
+        return decode
+
+
+@cache
+def _get_row_codec(model: type[BaseModel]) -> _RowCodec:
+    return _RowCodec(model)
+
+
+def make_row_decoder(
+    model: type[BaseModel], header: Sequence[str]
+) -> Callable[[Sequence[str]], dict[str, Any]]:
+    return _get_row_codec(model).decoder(header)
+
+
+def _decode_rows(text_reader: Iterable[str], model: type[BaseModel]) -> Iterable[dict[str, Any]]:
+    csv_reader = csv.reader(text_reader)
+    header = next(csv_reader, None)
+    if header is None:
+        return []
+    decode = make_row_decoder(model, header)
+    # Blank lines are skipped like csv.DictReader does
+    return (decode(row) for row in csv_reader if row)
+
+
+def read_records[T: BaseModel](
+    reader: BinaryIO, model: type[T], interner: StringInterner | None = None
+) -> list[T]:
     with managed_text_io(reader, encoding="utf-8") as text_reader:
-        csv_reader = csv.DictReader(text_reader)
-        return [model.model_validate(row) for row in csv_reader]
+        return validate_rows(_decode_rows(text_reader, model), model, interner)
+
+
+def iter_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> Iterator[T]:
+    with managed_text_io(reader, encoding="utf-8") as text_reader:
+        for row in _decode_rows(text_reader, model):
+            yield model.model_validate(row)
 
 
 def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
@@ -18,9 +152,13 @@ def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
     with managed_text_io(writer, encoding="utf-8", newline="") as text_writer:
         it = iter(records)
         first_record = next(it)
-        fields = list(type(first_record).model_fields.keys())
-        csv_writer = csv.DictWriter(text_writer, fieldnames=fields, lineterminator="\r\n")
-        csv_writer.writeheader()
-        csv_writer.writerow(first_record.model_dump(mode="json"))
-        for record in it:
-            csv_writer.writerow(record.model_dump(mode="json"))
+        codec = _get_row_codec(type(first_record))
+        csv_writer = csv.writer(text_writer, lineterminator="\r\n")
+        csv_writer.writerow(codec.columns)
+        csv_writer.writerow(codec.encode(first_record))
+        csv_writer.writerows(map(codec.encode, it))
+
+
+def read_raw_records(reader: BinaryIO, model: type[BaseModel]) -> list[dict[str, Any]]:
+    with managed_text_io(reader, encoding="utf-8") as text_reader:
+        return list(_decode_rows(text_reader, model))
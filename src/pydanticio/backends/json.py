@@ -1,4 +1,6 @@
-from typing import BinaryIO
+import json
+from collections.abc import Iterable
+from typing import Any, BinaryIO
 
 from pydantic import BaseModel
 
@@ -14,3 +16,18 @@ def read_record[T: BaseModel](reader: BinaryIO, model: type[T]) -> T:
 def write_record(writer: BinaryIO, record: BaseModel) -> None:
     with managed_text_io(writer, encoding="utf-8", newline="") as text_writer:
         text_writer.write(record.model_dump_json())
+
+
+def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
+    with managed_text_io(writer, encoding="utf-8", newline="") as text_writer:
+        text_writer.write("[")
+        for i, record in enumerate(records):
+            if i > 0:
+                text_writer.write(",")
+            text_writer.write(record.model_dump_json())
+        text_writer.write("]")
+
+
+def read_raw_records(reader: BinaryIO) -> list[Any]:
+    with managed_text_io(reader, encoding="utf-8") as text_reader:
+        return json.load(text_reader)
@@ -1,14 +1,26 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import BinaryIO
 
 from pydantic import BaseModel
 
+from ..interning import StringInterner
 from ..utils import managed_text_io
 
 
-def read_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> list[T]:
+def read_records[T: BaseModel](
+    reader: BinaryIO, model: type[T], interner: StringInterner | None = None
+) -> list[T]:
     with managed_text_io(reader, encoding="utf-8") as text_reader:
-        return [model.model_validate_json(line) for line in text_reader]
+        if interner is None:
+            return [model.model_validate_json(line) for line in text_reader]
+        # Records are validated in JSON mode and interned afterwards
+        return [interner.intern_record(model.model_validate_json(line)) for line in text_reader]
+
+
+def iter_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> Iterator[T]:
+    with managed_text_io(reader, encoding="utf-8") as text_reader:
+        for line in text_reader:
+            yield model.model_validate_json(line)
 
 
 def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
@@ -16,3 +28,8 @@ def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
         for record in records:
             text_writer.write(record.model_dump_json())
             text_writer.write("\n")
+
+
+def read_raw_records(reader: BinaryIO) -> list[str]:
+    with managed_text_io(reader, encoding="utf-8") as text_reader:
+        return list(text_reader)
@@ -1,8 +1,12 @@
-from typing import BinaryIO
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
 
 import msgpack
 from pydantic import BaseModel
 
+from ..interning import StringInterner, validate_rows
+from ..utils import write_length_prefixed_array
+
 
 def read_record[T: BaseModel](reader: BinaryIO, model: type[T]) -> T:
     data = reader.read()
@@ -15,12 +19,30 @@ def write_record(writer: BinaryIO, record: BaseModel) -> None:
     writer.write(data)  # type: ignore
 
 
-def read_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> list[T]:
+def read_records[T: BaseModel](
+    reader: BinaryIO, model: type[T], interner: StringInterner | None = None
+) -> list[T]:
     data = reader.read()
     unpacked = msgpack.unpackb(data)
-    return [model.model_validate(item) for item in unpacked]
+    return validate_rows(unpacked, model, interner)
 
 
-def write_records[T: BaseModel](writer: BinaryIO, records: list[T]) -> None:
-    data = msgpack.packb([record.model_dump(mode="json") for record in records])
-    writer.write(data)  # type: ignore
+def iter_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> Iterator[T]:
+    unpacker = msgpack.Unpacker(reader)
+    for _ in range(unpacker.read_array_header()):
+        yield model.model_validate(unpacker.unpack())
+
+
+def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
+    packer = msgpack.Packer()
+    write_length_prefixed_array(
+        writer,
+        records,
+        packer.pack_array_header,
+        lambda record: packer.pack(record.model_dump(mode="json")),
+    )
+
+
+def read_raw_records(reader: BinaryIO) -> list[Any]:
+    data = reader.read()
+    return msgpack.unpackb(data)
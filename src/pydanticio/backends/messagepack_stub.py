@@ -1,7 +1,10 @@
-from typing import BinaryIO
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
 
 from pydantic import BaseModel
 
+from ..interning import StringInterner
+
 
 def read_record[T: BaseModel](reader: BinaryIO, model: type[T]) -> T:
     raise NotImplementedError("messagepack backend is not available.")
@@ -11,9 +14,19 @@ def write_record(writer: BinaryIO, record: BaseModel) -> None:
     raise NotImplementedError("messagepack backend is not available.")
 
 
-def read_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> list[T]:
+def read_records[T: BaseModel](
+    reader: BinaryIO, model: type[T], interner: StringInterner | None = None
+) -> list[T]:
+    raise NotImplementedError("messagepack backend is not available.")
+
+
+def iter_records[T: BaseModel](reader: BinaryIO, model: type[T]) -> Iterator[T]:
+    raise NotImplementedError("messagepack backend is not available.")
+
+
+def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
     raise NotImplementedError("messagepack backend is not available.")
 
 
-def write_records[T: BaseModel](writer: BinaryIO, records: list[T]) -> None:
+def read_raw_records(reader: BinaryIO) -> list[Any]:
     raise NotImplementedError("messagepack backend is not available.")
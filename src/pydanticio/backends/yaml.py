@@ -1,4 +1,5 @@
-from typing import BinaryIO
+from collections.abc import Iterable
+from typing import Any, BinaryIO
 
 import yaml
 from pydantic import BaseModel
@@ -15,3 +16,19 @@ def read_record[T: BaseModel](reader: BinaryIO, model: type[T]) -> T:
 def write_record(writer: BinaryIO, record: BaseModel) -> None:
     with managed_text_io(writer, encoding="utf-8", newline="") as text_writer:
         yaml.safe_dump(record.model_dump(mode="json"), text_writer, line_break="\n")
+
+
+def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
+    with managed_text_io(writer, encoding="utf-8", newline="") as text_writer:
+        empty = True
+        for record in records:
+            # A block sequence is the concatenation of its single-item sequences
+            yaml.safe_dump([record.model_dump(mode="json")], text_writer, line_break="\n")
+            empty = False
+        if empty:
+            yaml.safe_dump([], text_writer, line_break="\n")
+
+
+def read_raw_records(reader: BinaryIO) -> list[Any]:
+    with managed_text_io(reader, encoding="utf-8") as text_reader:
+        return yaml.safe_load(text_reader)
@@ -1,4 +1,5 @@
-from typing import BinaryIO
+from collections.abc import Iterable
+from typing import Any, BinaryIO
 
 from pydantic import BaseModel
 
@@ -9,3 +10,11 @@ def read_record[T: BaseModel](reader: BinaryIO, model: type[T]) -> T:
 
 def write_record(writer: BinaryIO, record: BaseModel) -> None:
     raise NotImplementedError("yaml backend is not available.")
+
+
+def write_records(writer: BinaryIO, records: Iterable[BaseModel]) -> None:
+    raise NotImplementedError("yaml backend is not available.")
+
+
+def read_raw_records(reader: BinaryIO) -> list[Any]:
+    raise NotImplementedError("yaml backend is not available.")
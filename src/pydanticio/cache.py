@@ -0,0 +1,156 @@
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from pydantic import BaseModel
+
+from . import (
+    GenericDataFormat,
+    LinesOnlyDataFormat,
+    SingleOnlyDataFormat,
+    decide_data_format_from_path,
+    read_record_from_reader,
+    read_records_from_reader,
+)
+
+type _CacheKey = tuple[Path, int, int, type[BaseModel], str, bool]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    total_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    value: Any
+    num_bytes: int
+
+
+class ReadCache:
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        copy_records: bool | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.copy_records = copy_records
+        self._entries: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+                total_bytes=self._stats.total_bytes,
+            )
+
+    def _copy[T: BaseModel](self, record: T) -> T:
+        copy_records = self.copy_records
+        if copy_records is None:
+            # Instances of frozen models can be shared safely, anything else is copied
+            copy_records = not record.model_config.get("frozen", False)
+        return record.model_copy(deep=True) if copy_records else record
+
+    def _lookup(self, key: _CacheKey) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def _store(self, key: _CacheKey, value: Any, num_bytes: int) -> None:
+        if num_bytes > self.max_bytes:
+            return
+        with self._lock:
+            # Entries for older versions of the same file can never be hit again
+            self._discard_where(lambda k: k[0] == key[0] and k[3:] == key[3:])
+            self._entries[key] = _CacheEntry(value, num_bytes)
+            self._stats.total_bytes += num_bytes
+            while len(self._entries) > self.max_entries or self._stats.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._stats.total_bytes -= evicted.num_bytes
+                self._stats.evictions += 1
+
+    def _discard_where(self, predicate: Callable[[_CacheKey], bool]) -> None:
+        for key in [k for k in self._entries if predicate(k)]:
+            self._stats.total_bytes -= self._entries.pop(key).num_bytes
+
+    @staticmethod
+    def _make_key(
+        file_path: Path, reader: BinaryIO, model: type[BaseModel], data_format: str, multiple: bool
+    ) -> tuple[_CacheKey, int]:
+        stat = os.fstat(reader.fileno())
+        return (
+            (file_path, stat.st_mtime_ns, stat.st_size, model, data_format, multiple),
+            stat.st_size,
+        )
+
+    def read_record_from_file[T: BaseModel](
+        self,
+        file_path: str | Path,
+        model: type[T],
+        data_format: GenericDataFormat | SingleOnlyDataFormat | None = None,
+    ) -> T:
+        file_path = Path(file_path).resolve()
+        actual_data_format = data_format or decide_data_format_from_path(file_path)
+        if actual_data_format in ("csv", "json_lines"):
+            raise ValueError(
+                f"Data format {actual_data_format} is not supported for single record reading"
+            )
+        with file_path.open("rb") as reader:
+            key, num_bytes = self._make_key(file_path, reader, model, actual_data_format, False)
+            record = self._lookup(key)
+            if record is None:
+                record = read_record_from_reader(reader, model, actual_data_format)
+                self._store(key, record, num_bytes)
+        return self._copy(record)
+
+    def read_records_from_file[T: BaseModel](
+        self,
+        file_path: str | Path,
+        model: type[T],
+        data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+    ) -> list[T]:
+        file_path = Path(file_path).resolve()
+        actual_data_format = data_format or decide_data_format_from_path(file_path)
+        if actual_data_format in ("toml",):
+            raise ValueError(
+                f"Data format {actual_data_format} is not supported for multiple record reading"
+            )
+        with file_path.open("rb") as reader:
+            key, num_bytes = self._make_key(file_path, reader, model, actual_data_format, True)
+            records = self._lookup(key)
+            if records is None:
+                records = tuple(read_records_from_reader(reader, model, actual_data_format))
+                self._store(key, records, num_bytes)
+        # A fresh list is returned so that callers can't add or remove cached records
+        return [self._copy(record) for record in records]
+
+    def invalidate(self, file_path: str | Path) -> None:
+        file_path = Path(file_path).resolve()
+        with self._lock:
+            self._discard_where(lambda k: k[0] == file_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
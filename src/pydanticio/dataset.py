@@ -0,0 +1,139 @@
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from glob import glob
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from . import (
+    GenericDataFormat,
+    LinesOnlyDataFormat,
+    decide_data_format_from_path,
+    read_records_from_file,
+)
+
+type DatasetSource = str | Path | Iterable[str | Path]
+
+
+@dataclass(frozen=True)
+class Partition[T: BaseModel]:
+    path: Path
+    records: list[T]
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _is_readable_partition(path: Path) -> bool:
+    try:
+        return decide_data_format_from_path(path) != "toml"
+    except ValueError:
+        return False
+
+
+def resolve_dataset_paths(source: DatasetSource) -> list[Path]:
+    if isinstance(source, str | Path):
+        path = Path(source)
+        if path.is_dir():
+            candidates = list(path.iterdir())
+        elif any(c in str(source) for c in "*?["):
+            candidates = [Path(p) for p in glob(str(source), recursive=True)]
+        else:
+            return [path]
+        # Skip marker and checksum files (e.g. _SUCCESS, .crc) that commonly sit next to shards
+        return sorted(p for p in candidates if p.is_file() and _is_readable_partition(p))
+    return [Path(p) for p in source]
+
+
+def _read_partition[T: BaseModel](
+    path: Path,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat | None,
+) -> Partition[T]:
+    try:
+        return Partition(path, read_records_from_file(path, model, data_format))
+    except Exception as e:
+        return Partition(path, [], e)
+
+
+def iter_dataset_partitions[T: BaseModel](
+    source: DatasetSource,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+    *,
+    ordered: bool = True,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    executor: Executor | None = None,
+) -> Iterator[Partition[T]]:
+    paths = resolve_dataset_paths(source)
+    own_executor = executor is None
+    if executor is not None:
+        pool = executor
+    elif use_processes:
+        # Parsing and validation hold the GIL, so only processes spread them over cores
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    # Keep a bounded number of partitions in flight so that a slow consumer
+    # does not force the whole dataset into memory.
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    try:
+        path_iter = iter(paths)
+        pending: list[Future[Partition[T]]] = []
+
+        def submit_next() -> bool:
+            path = next(path_iter, None)
+            if path is None:
+                return False
+            pending.append(pool.submit(_read_partition, path, model, data_format))
+            return True
+
+        while len(pending) < window and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                future = pending.pop(0)
+            else:
+                future = next(as_completed(pending))
+                pending.remove(future)
+            submit_next()
+            yield future.result()
+    finally:
+        if own_executor:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def read_dataset[T: BaseModel](
+    source: DatasetSource,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+    *,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    executor: Executor | None = None,
+) -> list[T]:
+    records: list[T] = []
+    for partition in iter_dataset_partitions(
+        source,
+        model,
+        data_format,
+        max_workers=max_workers,
+        use_processes=use_processes,
+        executor=executor,
+    ):
+        if partition.error is not None:
+            raise partition.error
+        records.extend(partition.records)
+    return records
@@ -0,0 +1,90 @@
+import sys
+import types
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+
+def _is_str_annotation(annotation: Any) -> bool:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return args == [str]
+    return annotation is str
+
+
+@cache
+def _string_fields(model: type[BaseModel]) -> frozenset[str]:
+    # Keys under which a row may hold a field that stays a str after validation.
+    # Other values, such as numbers in CSV columns, are converted and their strings discarded.
+    names: set[str] = set()
+    for name, field in model.model_fields.items():
+        if _is_str_annotation(field.annotation):
+            names.add(name)
+            if isinstance(field.alias, str):
+                names.add(field.alias)
+    return frozenset(names)
+
+
+class StringInterner:
+    def __init__(self, fields: Iterable[str] | None = None, max_cardinality: int = 10_000) -> None:
+        # With no explicit fields, every field annotated as str is interned until
+        # it turns out to have more than max_cardinality distinct values.
+        self.fields = None if fields is None else frozenset(fields)
+        self.max_cardinality = max_cardinality
+        self.hits = 0
+        self.saved_bytes = 0
+        self._tables: dict[str, dict[str, str]] = {}
+        self._high_cardinality_fields: set[str] = set()
+
+    @property
+    def interned_fields(self) -> list[str]:
+        return sorted(self._tables)
+
+    def _table_for(self, field: str, model: type[BaseModel] | None) -> dict[str, str] | None:
+        if self.fields is not None:
+            if field not in self.fields:
+                return None
+        elif field in self._high_cardinality_fields or (
+            model is not None and field not in _string_fields(model)
+        ):
+            return None
+        return self._tables.setdefault(field, {})
+
+    def intern_row(self, row: Any, model: type[BaseModel] | None = None) -> Any:
+        if isinstance(row, dict):
+            self._intern_values(row, model)
+        return row
+
+    def intern_record[T: BaseModel](self, record: T) -> T:
+        # Values are replaced by equal strings, so bypassing validation and frozen checks is safe
+        self._intern_values(record.__dict__, type(record))
+        return record
+
+    def _intern_values(self, row: dict[str, Any], model: type[BaseModel] | None) -> None:
+        for field, value in row.items():
+            if type(value) is not str:
+                continue
+            table = self._table_for(field, model)
+            if table is None:
+                continue
+            shared = table.get(value)
+            if shared is None:
+                if self.fields is None and len(table) >= self.max_cardinality:
+                    self._high_cardinality_fields.add(field)
+                    del self._tables[field]
+                else:
+                    table[value] = value
+            elif shared is not value:
+                row[field] = shared
+                self.hits += 1
+                self.saved_bytes += sys.getsizeof(value)
+
+
+def validate_rows[T: BaseModel](
+    rows: Iterable[Any], model: type[T], interner: StringInterner | None = None
+) -> list[T]:
+    if interner is None:
+        return [model.model_validate(row) for row in rows]
+    return [model.model_validate(interner.intern_row(row, model)) for row in rows]
@@ -0,0 +1,118 @@
+import copy
+import json
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO, overload
+
+from pydantic import BaseModel
+
+from . import (
+    GenericDataFormat,
+    LinesOnlyDataFormat,
+    cbor_backend,
+    csv_backend,
+    decide_data_format_from_path,
+    jsl_backend,
+    json_backend,
+    messagepack_backend,
+    yaml_backend,
+)
+
+_NOT_VALIDATED: Any = object()
+
+
+class RecordList[T: BaseModel](Sequence[T]):
+    def __init__(self, rows: list[Any], validate: Callable[[Any], T]) -> None:
+        self._rows = rows
+        self._records: list[T] = [_NOT_VALIDATED] * len(rows)
+        self._validate = validate
+        # Slices are views that share rows and cached records with their parent
+        self._indices = range(len(rows))
+
+    def _get(self, index: int) -> T:
+        record = self._records[index]
+        if record is _NOT_VALIDATED:
+            record = self._validate(self._rows[index])
+            self._records[index] = record
+            # The raw row is no longer needed once its record is cached
+            self._rows[index] = None
+        return record
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordList[T]": ...
+
+    def __getitem__(self, index: int | slice) -> "T | RecordList[T]":
+        if isinstance(index, slice):
+            view = copy.copy(self)
+            view._indices = self._indices[index]
+            return view
+        return self._get(self._indices[index])
+
+    def __iter__(self) -> Iterator[T]:
+        for i in self._indices:
+            yield self._get(i)
+
+    def __repr__(self) -> str:
+        return f"RecordList(<{len(self)} records, {self.num_validated} validated>)"
+
+    @property
+    def num_validated(self) -> int:
+        return sum(1 for i in self._indices if self._records[i] is not _NOT_VALIDATED)
+
+    def validate_all(self) -> list[T]:
+        return list(self)
+
+
+def _as_rows(data: Any) -> list[Any]:
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a list of records, got {type(data).__name__}")
+    return data
+
+
+def read_lazy_records_from_reader[T: BaseModel](
+    reader: BinaryIO,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat,
+) -> RecordList[T]:
+    match data_format:
+        case "csv":
+            return RecordList(csv_backend.read_raw_records(reader, model), model.model_validate)
+        case "json_lines":
+            return RecordList(jsl_backend.read_raw_records(reader), model.model_validate_json)
+        case "json":
+            # Rows are re-encoded so that records are validated in JSON mode like the eager reader
+            return RecordList(
+                _as_rows(json_backend.read_raw_records(reader)),
+                lambda row: model.model_validate_json(json.dumps(row)),
+            )
+        case "yaml":
+            return RecordList(_as_rows(yaml_backend.read_raw_records(reader)), model.model_validate)
+        case "messagepack":
+            return RecordList(
+                _as_rows(messagepack_backend.read_raw_records(reader)), model.model_validate
+            )
+        case "cbor":
+            return RecordList(_as_rows(cbor_backend.read_raw_records(reader)), model.model_validate)
+        case _:
+            raise ValueError(f"Unsupported backend type: {data_format}")
+
+
+def read_lazy_records_from_file[T: BaseModel](
+    file_path: str | Path,
+    model: type[T],
+    data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+) -> RecordList[T]:
+    file_path = Path(file_path)
+    actual_data_format = data_format or decide_data_format_from_path(file_path)
+    if actual_data_format in ("toml",):
+        raise ValueError(
+            f"Data format {actual_data_format} is not supported for multiple record reading"
+        )
+    with file_path.open("rb") as reader:
+        return read_lazy_records_from_reader(reader, model, actual_data_format)
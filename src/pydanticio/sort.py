@@ -0,0 +1,190 @@
+import heapq
+import itertools
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from . import (
+    GenericDataFormat,
+    LinesOnlyDataFormat,
+    iter_records_from_file,
+    write_records_to_file,
+)
+
+# Upper bound on the number of runs merged at once, to stay clear of open file limits
+MAX_MERGE_FAN_IN = 64
+# Nesting depth of models and containers followed when estimating the size of a record
+MAX_SIZE_DEPTH = 16
+
+
+def _approximate_size(record: BaseModel) -> int:
+    size = 0
+    stack: list[tuple[Any, int]] = [(record, 0)]
+    while stack:
+        value, depth = stack.pop()
+        size += sys.getsizeof(value)
+        if depth >= MAX_SIZE_DEPTH:
+            continue
+        if isinstance(value, BaseModel):
+            size += sys.getsizeof(value.__dict__) + sys.getsizeof(value.__pydantic_fields_set__)
+            children = list(value.__dict__.values())
+            if value.__pydantic_extra__:
+                children.append(value.__pydantic_extra__)
+        elif isinstance(value, dict):
+            children = [*value.keys(), *value.values()]
+        elif isinstance(value, list | tuple | set | frozenset):
+            children = value
+        else:
+            continue
+        stack.extend((child, depth + 1) for child in children)
+    return size
+
+
+class _RunCodec[T: BaseModel]:
+    # Runs store each record as a pickled tuple of its field values plus the
+    # pydantic state that model_dump would drop (extra fields, fields set,
+    # private attributes), which is far more compact than pickling the model
+    # instance or its JSON form.
+    def __init__(self, model: type[T]) -> None:
+        self.model = model
+        self.field_names = list(model.model_fields)
+        self.all_fields = set(self.field_names)
+
+    def write_run(self, records: Iterable[T], run_path: Path) -> Path:
+        with run_path.open("wb") as run:
+            pickler = pickle.Pickler(run, protocol=pickle.HIGHEST_PROTOCOL)
+            for record in records:
+                fields_set = record.model_fields_set
+                pickler.dump(
+                    (
+                        tuple(getattr(record, name) for name in self.field_names),
+                        record.__pydantic_extra__,
+                        None if fields_set == self.all_fields else fields_set,
+                        record.__pydantic_private__,
+                    )
+                )
+                pickler.clear_memo()
+        return run_path
+
+    def read_run(self, run_path: Path) -> Iterator[T]:
+        with run_path.open("rb") as run:
+            while True:
+                # Each record is a separate pickle and is loaded by a fresh unpickler.
+                # A shared one would keep every record in its memo and resolve memo
+                # references of later records to objects of earlier ones.
+                # Runs are temporary files written by this module, never external input
+                try:
+                    values, extra, fields_set, private = pickle.load(run)  # noqa: S301
+                except EOFError:
+                    break
+                record = self.model.__new__(self.model)
+                record.__setstate__(
+                    {
+                        "__dict__": dict(zip(self.field_names, values, strict=True)),
+                        "__pydantic_extra__": extra,
+                        "__pydantic_fields_set__": (
+                            set(self.all_fields) if fields_set is None else fields_set
+                        ),
+                        "__pydantic_private__": private,
+                    }
+                )
+                yield record
+
+
+def _unique_by_key[T](records: Iterable[T], key: Callable[[T], Any]) -> Iterator[T]:
+    sentinel = last_key = object()
+    for record in records:
+        record_key = key(record)
+        if last_key is sentinel or record_key != last_key:
+            yield record
+        last_key = record_key
+
+
+def sort_records[T: BaseModel](
+    records: Iterable[T],
+    model: type[T],
+    key: str | Callable[[T], Any],
+    unique: bool = False,
+    reverse: bool = False,
+    memory_limit: int = 64 * 1024 * 1024,
+    temp_dir: str | None = None,
+) -> Iterator[T]:
+    key_func: Callable[[T], Any] = attrgetter(key) if isinstance(key, str) else key
+    codec = _RunCodec(model)
+
+    def finish(sorted_records: Iterable[T]) -> Iterable[T]:
+        return _unique_by_key(sorted_records, key_func) if unique else sorted_records
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        # Runs are closed once written and only opened while they are merged,
+        # so at most MAX_MERGE_FAN_IN files are open at a time
+        run_paths = (Path(run_dir) / f"run-{i}" for i in itertools.count())
+        runs: list[Path] = []
+
+        buffer: list[T] = []
+        buffer_size = 0
+        for record in records:
+            buffer.append(record)
+            buffer_size += _approximate_size(record)
+            if buffer_size >= memory_limit:
+                buffer.sort(key=key_func, reverse=reverse)
+                runs.append(codec.write_run(finish(buffer), next(run_paths)))
+                buffer.clear()
+                buffer_size = 0
+
+        buffer.sort(key=key_func, reverse=reverse)
+        if not runs:
+            yield from finish(buffer)
+            return
+        runs.append(codec.write_run(finish(buffer), next(run_paths)))
+        buffer.clear()
+
+        def merge(batch: list[Path]) -> Iterable[T]:
+            runs_iter = (codec.read_run(run) for run in batch)
+            return finish(heapq.merge(*runs_iter, key=key_func, reverse=reverse))
+
+        # Merge in several passes when there are too many runs to open at once.
+        # Adjacent runs are merged together so that equal keys keep their input order.
+        while len(runs) > MAX_MERGE_FAN_IN:
+            merged_runs: list[Path] = []
+            for i in range(0, len(runs), MAX_MERGE_FAN_IN):
+                batch = runs[i : i + MAX_MERGE_FAN_IN]
+                merged_runs.append(codec.write_run(merge(batch), next(run_paths)))
+                for run in batch:
+                    run.unlink()
+            runs = merged_runs
+
+        yield from merge(runs)
+
+
+def sort_records_file[T: BaseModel](
+    src: str | Path,
+    dst: str | Path,
+    model: type[T],
+    key: str | Callable[[T], Any],
+    unique: bool = False,
+    reverse: bool = False,
+    memory_limit: int = 64 * 1024 * 1024,
+    src_data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+    dst_data_format: GenericDataFormat | LinesOnlyDataFormat | None = None,
+    temp_dir: str | None = None,
+) -> None:
+    if Path(src).resolve() == Path(dst).resolve():
+        raise ValueError("Source and destination of sorting must be different files")
+    records = iter_records_from_file(src, model, src_data_format)
+    sorted_records = sort_records(
+        records,
+        model,
+        key,
+        unique=unique,
+        reverse=reverse,
+        memory_limit=memory_limit,
+        temp_dir=temp_dir,
+    )
+    write_records_to_file(dst, sorted_records, dst_data_format)
@@ -0,0 +1,167 @@
+import csv
+import hashlib
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import BaseModel, ConfigDict
+
+from . import LinesOnlyDataFormat, decide_data_format_from_path
+from .backends.csv import make_row_decoder
+
+# Number of leading bytes hashed to detect a file that was replaced or rewritten in place
+HEAD_HASH_SIZE = 4096
+
+
+class Checkpoint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    offset: int = 0
+    device: int | None = None
+    inode: int | None = None
+    head_hash: str | None = None
+    csv_header: list[str] | None = None
+
+
+class _CompleteLines:
+    # Yields the lines that end with a newline and remembers their raw bytes, so
+    # that a partially written final line is left for the next read.
+    def __init__(self, reader: BinaryIO) -> None:
+        self.reader = reader
+        self.consumed: list[bytes] = []
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = self.reader.readline()
+        if not line.endswith(b"\n"):
+            raise StopIteration
+        self.consumed.append(line)
+        return line.decode("utf-8")
+
+    def take_consumed(self) -> bytes:
+        data = b"".join(self.consumed)
+        self.consumed.clear()
+        return data
+
+
+def _head_hash(reader: BinaryIO, offset: int) -> str:
+    reader.seek(0)
+    return hashlib.blake2b(reader.read(min(offset, HEAD_HASH_SIZE)), digest_size=16).hexdigest()
+
+
+def _resume_offset(reader: BinaryIO, checkpoint: Checkpoint) -> int:
+    if checkpoint.offset == 0:
+        return 0
+    stat = os.fstat(reader.fileno())
+    if (checkpoint.device, checkpoint.inode) != (stat.st_dev, stat.st_ino):
+        # The file was rotated and a new one was created in its place
+        return 0
+    if stat.st_size < checkpoint.offset:
+        # The file was truncated
+        return 0
+    if _head_hash(reader, checkpoint.offset) != checkpoint.head_hash:
+        # The file was rewritten in place
+        return 0
+    return checkpoint.offset
+
+
+def _read_json_lines[T: BaseModel](lines: _CompleteLines, model: type[T]) -> tuple[list[T], int]:
+    records: list[T] = []
+    consumed = 0
+    for line in lines:
+        if line.strip():
+            records.append(model.model_validate_json(line))
+        consumed += len(lines.take_consumed())
+    return records, consumed
+
+
+def _ends_inside_quoted_field(raw: bytes) -> bool:
+    # Only the strict parser tells an unterminated quoted field apart from a
+    # complete record, the lenient one just returns what it has at end of input.
+    try:
+        for _ in csv.reader(raw.decode("utf-8").splitlines(keepends=True), strict=True):
+            pass
+    except csv.Error as e:
+        return "unexpected end of data" in str(e)
+    return False
+
+
+def _read_csv[T: BaseModel](
+    lines: _CompleteLines, model: type[T], header: list[str] | None
+) -> tuple[list[T], int, list[str] | None]:
+    records: list[T] = []
+    consumed = 0
+    decode = None if header is None else make_row_decoder(model, header)
+    for row in csv.reader(lines):
+        raw = lines.take_consumed()
+        # A quoted field that continues on a line which has not been fully
+        # written yet is left for the next read
+        if b'"' in raw and _ends_inside_quoted_field(raw):
+            break
+        consumed += len(raw)
+        if decode is None:
+            header = row
+            decode = make_row_decoder(model, row)
+        elif row:
+            records.append(model.model_validate(decode(row)))
+    return records, consumed, header
+
+
+def read_new_records[T: BaseModel](
+    file_path: str | Path,
+    model: type[T],
+    checkpoint: Checkpoint | None = None,
+    data_format: LinesOnlyDataFormat | None = None,
+) -> tuple[list[T], Checkpoint]:
+    file_path = Path(file_path)
+    actual_data_format = data_format or decide_data_format_from_path(file_path)
+    if actual_data_format not in ("csv", "json_lines"):
+        raise ValueError(
+            f"Data format {actual_data_format} is not supported for incremental reading"
+        )
+    checkpoint = checkpoint or Checkpoint()
+
+    with file_path.open("rb") as reader:
+        offset = _resume_offset(reader, checkpoint)
+        csv_header = checkpoint.csv_header if offset > 0 else None
+        reader.seek(offset)
+        lines = _CompleteLines(reader)
+        if actual_data_format == "json_lines":
+            records, consumed = _read_json_lines(lines, model)
+        else:
+            records, consumed, csv_header = _read_csv(lines, model, csv_header)
+        offset += consumed
+
+        stat = os.fstat(reader.fileno())
+        new_checkpoint = Checkpoint(
+            offset=offset,
+            device=stat.st_dev,
+            inode=stat.st_ino,
+            head_hash=_head_hash(reader, offset),
+            csv_header=csv_header,
+        )
+    return records, new_checkpoint
+
+
+def follow_records[T: BaseModel](
+    file_path: str | Path,
+    model: type[T],
+    checkpoint: Checkpoint | None = None,
+    data_format: LinesOnlyDataFormat | None = None,
+    poll_interval: float = 1.0,
+) -> Iterator[tuple[list[T], Checkpoint]]:
+    while True:
+        try:
+            records, checkpoint = read_new_records(file_path, model, checkpoint, data_format)
+        except FileNotFoundError:
+            # The file is being rotated; wait for the new one to appear
+            time.sleep(poll_interval)
+            continue
+        if records:
+            yield records, checkpoint
+        else:
+            time.sleep(poll_interval)
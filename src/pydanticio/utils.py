@@ -1,10 +1,16 @@
 import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Sized
 from contextlib import contextmanager
 from io import TextIOWrapper
 from typing import BinaryIO
 
 PLATFORM_NEWLINE = "\r\n" if os.name == "nt" else "\n"
 
+# Encoded items are kept in memory up to this size before spilling to a temporary file
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
 
 @contextmanager
 def managed_text_io(binary_io: BinaryIO, encoding: str = "utf-8", newline: str | None = None):
@@ -15,3 +21,27 @@ def managed_text_io(binary_io: BinaryIO, encoding: str = "utf-8", newline: str |
         if not wrapper.closed:
             wrapper.flush()
             wrapper.detach()
+
+
+def write_length_prefixed_array[T](
+    writer: BinaryIO,
+    items: Iterable[T],
+    encode_header: Callable[[int], bytes],
+    encode_item: Callable[[T], bytes],
+) -> None:
+    if isinstance(items, Sized):
+        writer.write(encode_header(len(items)))
+        for item in items:
+            writer.write(encode_item(item))
+        return
+
+    # The array header carries the item count, which is unknown until the
+    # iterable is exhausted, so encoded items are spooled and copied after it.
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        count = 0
+        for item in items:
+            spool.write(encode_item(item))
+            count += 1
+        writer.write(encode_header(count))
+        spool.seek(0)
+        shutil.copyfileobj(spool, writer)
@@ -0,0 +1,102 @@
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel
+from pytest import raises
+
+from pydanticio import write_record_to_file, write_records_to_file
+from pydanticio.cache import ReadCache
+
+from . import SampleRecord, test_records
+
+
+class MutableRecord(BaseModel):
+    a: int
+    b: int
+    s: str
+    x: float
+    y: float
+
+
+def test_read_records_from_file_cached():
+    cache = ReadCache()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "test_records.jsonl"
+        write_records_to_file(temp_path, test_records)
+
+        first = cache.read_records_from_file(temp_path, SampleRecord)
+        second = cache.read_records_from_file(temp_path, SampleRecord)
+        assert first == second == test_records
+        assert first is not second
+        # SampleRecord is frozen, so cached instances are shared
+        assert first[0] is second[0]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+        # Modifying the file changes its size and mtime, so the stale entry is replaced
+        write_records_to_file(temp_path, test_records[:1])
+        assert cache.read_records_from_file(temp_path, SampleRecord) == test_records[:1]
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.entries) == (1, 2, 1)
+
+        cache.invalidate(temp_path)
+        assert cache.stats.entries == 0
+
+
+def test_read_record_from_file_cached():
+    cache = ReadCache()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "test_record.json"
+        write_record_to_file(temp_path, test_records[0])
+
+        assert cache.read_record_from_file(temp_path, SampleRecord) == test_records[0]
+        assert cache.read_record_from_file(temp_path, SampleRecord) == test_records[0]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+        with raises(ValueError):
+            cache.read_record_from_file(temp_path, SampleRecord, data_format="csv")  # type: ignore
+
+
+def test_copy_records():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "test_records.json"
+        write_records_to_file(temp_path, test_records)
+
+        # Records of mutable models are copied by default
+        cache = ReadCache()
+        records = cache.read_records_from_file(temp_path, MutableRecord)
+        records[0].a = 100
+        assert cache.read_records_from_file(temp_path, MutableRecord)[0].a == 1
+
+        cache = ReadCache(copy_records=True)
+        first = cache.read_records_from_file(temp_path, SampleRecord)
+        assert cache.read_records_from_file(temp_path, SampleRecord)[0] is not first[0]
+
+        cache = ReadCache(copy_records=False)
+        first = cache.read_records_from_file(temp_path, MutableRecord)
+        assert cache.read_records_from_file(temp_path, MutableRecord)[0] is first[0]
+
+
+def test_lru_eviction():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = [Path(temp_dir) / f"test_records_{i}.jsonl" for i in range(3)]
+        for path in paths:
+            write_records_to_file(path, test_records)
+
+        cache = ReadCache(max_entries=2)
+        for path in [paths[0], paths[1], paths[0], paths[2]]:
+            cache.read_records_from_file(path, SampleRecord)
+        assert (cache.stats.entries, cache.stats.evictions) == (2, 1)
+
+        cache.read_records_from_file(paths[0], SampleRecord)
+        assert cache.stats.hits == 2
+
+        size = paths[0].stat().st_size
+        cache = ReadCache(max_bytes=2 * size)
+        for path in paths:
+            cache.read_records_from_file(path, SampleRecord)
+        assert cache.stats.total_bytes == 2 * size
+        assert cache.stats.evictions == 1
+
+        cache.clear()
+        assert cache.stats == type(cache.stats)()
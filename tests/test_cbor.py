@@ -37,3 +37,11 @@ def test_write_list_of_records_to_writer():
     writer = BytesIO()
     write_records_to_writer(writer, test_records, "cbor")
     assert writer.getvalue() == data
+
+
+def test_write_records_from_generator_to_writer():
+    records = [test_records[i % 2] for i in range(100)]
+    data = cbor2.dumps([record.model_dump(mode="json") for record in records], canonical=True)  # type: ignore
+    writer = BytesIO()
+    write_records_to_writer(writer, (record for record in records), "cbor")
+    assert writer.getvalue() == data
@@ -1,6 +1,8 @@
 import os
 from io import BytesIO
 
+from pydantic import BaseModel, Field, RootModel
+
 from pydanticio import read_records_from_reader, write_records_to_writer
 
 from . import SampleRecord, test_records
@@ -28,3 +30,122 @@ def test_write_records_to_writer():
     writer = BytesIO()
     write_records_to_writer(writer, test_records, "csv")
     assert writer.getvalue().decode("utf-8").strip() == records_str.strip()
+
+
+class Address(BaseModel):
+    city: str
+    zip_code: str
+
+
+class Customer(BaseModel):
+    name: str
+    address: Address
+    age: int
+
+
+customers = [
+    Customer(name="alice", address=Address(city="Tokyo", zip_code="100-0001"), age=30),
+    Customer(name="bob", address=Address(city="Paris", zip_code="75001"), age=25),
+]
+
+customers_str = (
+    "name,address.city,address.zip_code,age\r\nalice,Tokyo,100-0001,30\r\nbob,Paris,75001,25\r\n"
+)
+
+
+def test_write_nested_records_to_writer():
+    writer = BytesIO()
+    write_records_to_writer(writer, customers, "csv")
+    assert writer.getvalue().decode("utf-8") == customers_str
+
+
+def test_read_nested_records_from_reader():
+    reader = BytesIO(customers_str.encode("utf-8"))
+    records = read_records_from_reader(reader, Customer, "csv")
+    assert records == customers
+
+
+def test_read_records_with_reordered_columns_and_blank_lines():
+    data = "y,x,s,b,a\r\n2.71,3.14,hello,2,1\r\n\r\n3.14,2.71,world,3,2\r\n"
+    reader = BytesIO(data.encode("utf-8"))
+    records = read_records_from_reader(reader, SampleRecord, "csv")
+    assert records == test_records
+
+
+class Tags(RootModel[str]):
+    pass
+
+
+class Tagged(BaseModel):
+    a: int
+    t: Tags
+
+
+def test_root_model_fields_are_not_flattened():
+    writer = BytesIO()
+    write_records_to_writer(writer, [Tagged(a=1, t=Tags("x"))], "csv")
+    assert writer.getvalue() == b"a,t\r\n1,x\r\n"
+
+    records = read_records_from_reader(BytesIO(writer.getvalue()), Tagged, "csv")
+    assert records == [Tagged(a=1, t=Tags("x"))]
+
+
+class Contact(BaseModel):
+    name: str
+    address: Address | None = None
+
+
+def test_optional_nested_records():
+    contacts = [
+        Contact(name="alice", address=Address(city="Tokyo", zip_code="100-0001")),
+        Contact(name="bob"),
+    ]
+    writer = BytesIO()
+    write_records_to_writer(writer, contacts, "csv")
+    assert writer.getvalue() == (
+        b"name,address.city,address.zip_code\r\nalice,Tokyo,100-0001\r\nbob,,\r\n"
+    )
+
+    records = read_records_from_reader(BytesIO(writer.getvalue()), Contact, "csv")
+    assert records == contacts
+
+
+class Meta(BaseModel):
+    note: str | None = None
+
+
+class WithMeta(BaseModel):
+    a: int
+    meta: Meta | None = None
+
+
+def test_empty_optional_nested_record_is_read_as_none():
+    writer = BytesIO()
+    write_records_to_writer(writer, [WithMeta(a=1, meta=Meta())], "csv")
+    assert writer.getvalue() == b"a,meta.note\r\n1,\r\n"
+
+    records = read_records_from_reader(BytesIO(writer.getvalue()), WithMeta, "csv")
+    assert records == [WithMeta(a=1, meta=None)]
+
+
+class WithSecret(BaseModel):
+    a: int
+    secret: str = Field(default="", exclude=True)
+
+
+class NestedSecret(BaseModel):
+    a: int
+    inner: WithSecret
+
+
+def test_excluded_fields_are_written_as_empty_columns():
+    writer = BytesIO()
+    write_records_to_writer(writer, [WithSecret(a=1, secret="s")], "csv")
+    assert writer.getvalue() == b"a,secret\r\n1,\r\n"
+
+    writer = BytesIO()
+    write_records_to_writer(writer, [NestedSecret(a=1, inner=WithSecret(a=2, secret="s"))], "csv")
+    assert writer.getvalue() == b"a,inner.a,inner.secret\r\n1,2,\r\n"
+
+    records = read_records_from_reader(BytesIO(writer.getvalue()), NestedSecret, "csv")
+    assert records == [NestedSecret(a=1, inner=WithSecret(a=2))]
@@ -0,0 +1,66 @@
+import tempfile
+from pathlib import Path
+
+from pytest import raises
+
+from pydanticio import write_records_to_file
+from pydanticio.dataset import iter_dataset_partitions, read_dataset, resolve_dataset_paths
+
+from . import SampleRecord, test_records
+
+
+def _write_shards(root: Path) -> list[Path]:
+    paths = [root / "part-0001.jsonl", root / "part-0002.csv", root / "part-0003.json"]
+    for path in paths:
+        write_records_to_file(path, test_records)
+    (root / "_SUCCESS").touch()
+    return paths
+
+
+def test_resolve_dataset_paths():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        paths = _write_shards(root)
+
+        assert resolve_dataset_paths(root) == paths
+        assert resolve_dataset_paths(str(root / "part-*")) == paths
+        assert resolve_dataset_paths(str(root / "*")) == paths
+        assert resolve_dataset_paths(reversed(paths)) == paths[::-1]
+
+
+def test_read_dataset_mixed_formats():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        _write_shards(root)
+
+        records = read_dataset(root, SampleRecord, max_workers=2)
+        assert records == test_records * 3
+
+        records = read_dataset(root, SampleRecord, max_workers=2, use_processes=True)
+        assert records == test_records * 3
+
+
+def test_iter_dataset_partitions_unordered():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        paths = _write_shards(root)
+
+        partitions = list(iter_dataset_partitions(root, SampleRecord, ordered=False))
+        assert sorted(p.path for p in partitions) == paths
+        assert all(p.ok and p.records == test_records for p in partitions)
+
+
+def test_partition_error_reporting():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        paths = _write_shards(root)
+        broken = root / "part-0004.jsonl"
+        broken.write_text('{"a": "not a number"}\n')
+
+        partitions = list(iter_dataset_partitions(root, SampleRecord))
+        assert [p.path for p in partitions] == [*paths, broken]
+        assert partitions[-1].error is not None
+        assert partitions[-1].records == []
+
+        with raises(ValueError):
+            read_dataset(root, SampleRecord)
@@ -0,0 +1,101 @@
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict
+
+from pydanticio import StringInterner, read_records_from_file, write_records_to_file
+
+
+class Person(BaseModel):
+    name: str
+    country: str
+    age: int
+
+
+people = [Person(name=f"person-{i}", country=["Japan", "France"][i % 2], age=i) for i in range(20)]
+
+
+def test_intern_row():
+    interner = StringInterner(fields=["country"])
+    rows = [{"country": "".join(["Jap", "an"]), "name": "".join(["a", "b"])} for _ in range(3)]
+    for row in rows:
+        interner.intern_row(row)
+
+    assert rows[0]["country"] is rows[1]["country"] is rows[2]["country"]
+    assert rows[0]["name"] is not rows[1]["name"]
+    assert interner.interned_fields == ["country"]
+    assert interner.hits == 2
+    assert interner.saved_bytes > 0
+
+
+def test_auto_interning_skips_high_cardinality_fields():
+    interner = StringInterner(max_cardinality=5)
+    for person in people:
+        interner.intern_row(json.loads(person.model_dump_json()))
+
+    assert interner.interned_fields == ["country"]
+    assert interner.hits == 18
+
+
+def test_read_records_from_file_with_interner():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for suffix in (".csv", ".jsonl", ".json", ".yaml", ".msgpack", ".cbor"):
+            temp_path = Path(temp_dir) / f"people{suffix}"
+            write_records_to_file(temp_path, people)
+
+            interner = StringInterner(max_cardinality=5)
+            records = read_records_from_file(temp_path, Person, interner=interner)
+            assert records == people
+            assert records[0].country is records[2].country
+            # pydantic's JSON parser already caches short strings, leaving nothing to replace
+            if suffix not in (".jsonl", ".json"):
+                assert interner.hits == 18
+
+
+class StrictEvent(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+    status: str
+    at: datetime
+
+
+def test_auto_interning_skips_fields_not_annotated_as_str():
+    people = [Person(name="anonymous", country="JP", age=10 + i % 3) for i in range(1000)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "people.csv"
+        write_records_to_file(temp_path, people)
+
+        interner = StringInterner()
+        records = read_records_from_file(temp_path, Person, interner=interner)
+        assert records == people
+        assert interner.interned_fields == ["country", "name"]
+        assert interner.hits == 2 * 999
+
+        explicit_interner = StringInterner(fields=["country", "name"])
+        read_records_from_file(temp_path, Person, interner=explicit_interner)
+        assert interner.saved_bytes == explicit_interner.saved_bytes
+
+
+def test_interning_keeps_json_mode_validation():
+    events = [StrictEvent(status="ok", at=datetime(2024, 1, 1, i)) for i in range(3)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for suffix in (".jsonl", ".json"):
+            temp_path = Path(temp_dir) / f"events{suffix}"
+            write_records_to_file(temp_path, events)
+
+            interner = StringInterner(fields=["status"])
+            records = read_records_from_file(temp_path, StrictEvent, interner=interner)
+            assert records == events
+            assert records[0].status is records[2].status
+
+
+def test_intern_record():
+    interner = StringInterner(fields=["country"])
+    records = [Person(name="a", country="".join(["Jap", "an"]), age=i) for i in range(3)]
+    for record in records:
+        interner.intern_record(record)
+
+    assert records[0].country is records[1].country is records[2].country
+    assert interner.hits == 2
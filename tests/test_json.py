@@ -38,3 +38,15 @@ def test_write_list_of_records_to_writer():
     writer = BytesIO()
     write_records_to_writer(writer, test_records, "json")
     assert writer.getvalue() == records_str.encode("utf-8")
+
+
+def test_write_records_from_generator_to_writer():
+    records_str = ",".join(record.model_dump_json() for record in test_records)
+    records_str = f"[{records_str}]"
+    writer = BytesIO()
+    write_records_to_writer(writer, (record for record in test_records), "json")
+    assert writer.getvalue() == records_str.encode("utf-8")
+
+    writer = BytesIO()
+    write_records_to_writer(writer, iter([]), "json")
+    assert writer.getvalue() == b"[]"
@@ -1,6 +1,6 @@
 from io import BytesIO
 
-from pydanticio import read_records_from_reader, write_records_to_writer
+from pydanticio import iter_records_from_reader, read_records_from_reader, write_records_to_writer
 
 from . import SampleRecord, test_records
 
@@ -17,3 +17,10 @@ def test_write_records_to_writer():
     writer = BytesIO()
     write_records_to_writer(writer, test_records, "json_lines")
     assert writer.getvalue().decode("utf-8").strip().splitlines() == record_lines
+
+
+def test_iter_records_from_reader():
+    reader = BytesIO("\n".join(record_lines).encode("utf-8"))
+    records = iter_records_from_reader(reader, SampleRecord, "json_lines")
+    assert next(records) == test_records[0]
+    assert list(records) == test_records[1:]
@@ -4,6 +4,7 @@ from pydanticio import (
     read_record_from_reader,
     write_record_to_writer,
     read_records_from_reader,
+    iter_records_from_reader,
     write_records_to_writer,
 )
 import msgpack
@@ -37,3 +38,19 @@ def test_write_list_of_records_to_writer():
     writer = BytesIO()
     write_records_to_writer(writer, test_records, "messagepack")
     assert writer.getvalue() == data
+
+
+def test_write_records_from_generator_to_writer():
+    records = [test_records[i % 2] for i in range(100)]
+    data = msgpack.packb([record.model_dump(mode="json") for record in records])  # type: ignore
+    writer = BytesIO()
+    write_records_to_writer(writer, (record for record in records), "messagepack")
+    assert writer.getvalue() == data
+
+
+def test_iter_records_from_reader():
+    data = msgpack.packb([record.model_dump(mode="json") for record in test_records])
+    reader = BytesIO(data)  # type: ignore
+    records = iter_records_from_reader(reader, SampleRecord, "messagepack")
+    assert next(records) == test_records[0]
+    assert list(records) == test_records[1:]
@@ -0,0 +1,77 @@
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict
+from pytest import raises
+
+from pydanticio import write_records_to_file
+from pydanticio.record_list import RecordList, read_lazy_records_from_file
+
+from . import SampleRecord, test_records
+
+
+def test_record_list_validates_on_access():
+    rows = [record.model_dump() for record in test_records] + [{"a": "not a number"}]
+    records = RecordList(rows, SampleRecord.model_validate)
+
+    assert len(records) == 3
+    assert records.num_validated == 0
+    assert records[1] == test_records[1]
+    assert records[-2] is records[1]
+    assert records.num_validated == 1
+
+    head = records[:2]
+    assert list(head) == test_records
+    assert head[0] is records[0]
+    assert records.num_validated == 2
+    assert records[::-1].num_validated == 2
+    assert len(records[1:][1:]) == 1
+
+    with raises(IndexError):
+        records[3]
+
+    with raises(ValueError):
+        records.validate_all()
+
+
+def test_read_lazy_records_from_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for suffix in (".csv", ".jsonl", ".json", ".yaml", ".msgpack", ".cbor"):
+            temp_path = Path(temp_dir) / f"test_records{suffix}"
+            write_records_to_file(temp_path, test_records)
+
+            records = read_lazy_records_from_file(temp_path, SampleRecord)
+            assert len(records) == len(test_records)
+            assert records.validate_all() == test_records
+            assert records.num_validated == len(test_records)
+
+
+def test_read_lazy_records_from_file_unsupported_format():
+    with raises(ValueError):
+        read_lazy_records_from_file("test_record.toml", SampleRecord)
+
+
+class Event(BaseModel):
+    model_config = ConfigDict(strict=True)
+
+    name: str
+    at: datetime
+
+
+def test_read_lazy_json_records_in_json_mode():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "events.json"
+        events = [Event(name="start", at=datetime(2024, 1, 1, 12, 0))]
+        write_records_to_file(temp_path, events)
+
+        assert read_lazy_records_from_file(temp_path, Event)[0] == events[0]
+
+
+def test_read_lazy_records_from_file_not_a_list():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "test_record.json"
+        temp_path.write_text(test_records[0].model_dump_json())
+
+        with raises(ValueError):
+            read_lazy_records_from_file(temp_path, SampleRecord)
@@ -0,0 +1,123 @@
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict
+from pytest import importorskip, raises
+
+from pydanticio import read_records_from_file, write_records_to_file
+from pydanticio.sort import sort_records, sort_records_file
+
+from . import SampleRecord
+
+records = [
+    SampleRecord(a=(i * 7919) % 101, b=i, s=f"record-{i}", x=i / 2, y=-i) for i in range(500)
+]
+
+
+def test_sort_records_in_memory():
+    result = list(sort_records(records, SampleRecord, key="a"))
+    assert result == sorted(records, key=lambda r: r.a)
+
+
+def test_sort_records_with_spilled_runs():
+    # A tiny memory limit forces one run per record and a multi-pass merge
+    result = list(sort_records(records, SampleRecord, key="a", memory_limit=1))
+    assert result == sorted(records, key=lambda r: r.a)
+
+    result = list(
+        sort_records(records, SampleRecord, key=lambda r: r.a % 10, reverse=True, memory_limit=1)
+    )
+    assert result == sorted(records, key=lambda r: r.a % 10, reverse=True)
+
+
+def test_sort_records_unique():
+    result = list(sort_records(records, SampleRecord, key="a", unique=True, memory_limit=1000))
+    assert [r.a for r in result] == list(range(101))
+    first_seen = {}
+    for record in records:
+        first_seen.setdefault(record.a, record)
+    assert result == [first_seen[a] for a in range(101)]
+
+
+def test_sort_records_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        src = Path(temp_dir) / "records.jsonl"
+        write_records_to_file(src, records)
+
+        for suffix in (".csv", ".json", ".msgpack"):
+            dst = Path(temp_dir) / f"sorted{suffix}"
+            sort_records_file(src, dst, SampleRecord, key="b", reverse=True, memory_limit=10_000)
+            assert read_records_from_file(dst, SampleRecord) == records[::-1]
+
+        with raises(ValueError):
+            sort_records_file(src, src, SampleRecord, key="a")
+
+
+def test_sort_records_open_file_limit():
+    resource = importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(128, hard), hard))
+    try:
+        many_records = records * 2
+        result = list(sort_records(many_records, SampleRecord, key="a", memory_limit=1))
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    assert result == sorted(many_records, key=lambda r: r.a)
+
+
+class ExtraRecord(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    a: int
+    b: int = 0
+
+
+def test_spilled_records_keep_pydantic_state():
+    extra_records = [ExtraRecord(a=i % 7, extra_field=f"x{i}") for i in range(50)]
+    in_memory = list(sort_records(extra_records, ExtraRecord, key="a"))
+    spilled = list(sort_records(extra_records, ExtraRecord, key="a", memory_limit=1))
+
+    assert spilled == in_memory
+    assert [r.model_dump() for r in spilled] == [r.model_dump() for r in in_memory]
+    assert all(r.model_fields_set == {"a", "extra_field"} for r in spilled)
+    assert spilled[0].model_dump(exclude_unset=True) == in_memory[0].model_dump(exclude_unset=True)
+
+
+class Inner(BaseModel):
+    name: str
+    score: float
+
+
+class NestedRecord(BaseModel):
+    a: int
+    inner: Inner
+    tags: list[str]
+
+
+def make_nested_records(count):
+    for i in range(count):
+        # Repeated values are the same object, which pickle memoizes within a record
+        tag = f"tag-{i}"
+        yield NestedRecord(
+            a=i % 97, inner=Inner(name=f"inner-{i}", score=i / 3), tags=[tag] * 10 + [f"x{i}"] * 10
+        )
+
+
+def test_spilled_nested_records_stay_within_memory_limit():
+    memory_limit = 1_000_000
+    tracemalloc.start()
+    try:
+        keys = [
+            (r.a, r.inner.name, r.tags[0])
+            for r in sort_records(
+                make_nested_records(5000), NestedRecord, key="a", memory_limit=memory_limit
+            )
+        ]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    expected = sorted(make_nested_records(5000), key=lambda r: r.a)
+    assert keys == [(r.a, r.inner.name, r.tags[0]) for r in expected]
+    assert peak < 2 * memory_limit
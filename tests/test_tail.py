@@ -0,0 +1,120 @@
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel
+from pytest import raises
+
+from pydanticio import write_records_to_file
+from pydanticio.tail import Checkpoint, follow_records, read_new_records
+
+from . import SampleRecord, test_records
+
+
+class Item(BaseModel):
+    a: int
+    s: str
+
+
+record_lines = [record.model_dump_json() + "\n" for record in test_records]
+csv_rows = [record.to_csv_row() + "\r\n" for record in test_records]
+
+
+def test_read_new_json_lines_records():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "log.jsonl"
+        temp_path.write_text(record_lines[0] + record_lines[1][:10])
+
+        records, checkpoint = read_new_records(temp_path, SampleRecord)
+        assert records == test_records[:1]
+        assert checkpoint.offset == len(record_lines[0])
+
+        # The partially written line is read once it is complete
+        with temp_path.open("a") as f:
+            f.write(record_lines[1][10:])
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert records == test_records[1:]
+
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert records == []
+
+        # The checkpoint can be stored and restored between runs
+        restored = Checkpoint.model_validate_json(checkpoint.model_dump_json())
+        with temp_path.open("a") as f:
+            f.write(record_lines[0])
+        records, _ = read_new_records(temp_path, SampleRecord, restored)
+        assert records == test_records[:1]
+
+
+def test_read_new_csv_records():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "log.csv"
+        temp_path.write_text(test_records[0].get_csv_header() + "\r\n" + csv_rows[0])
+
+        records, checkpoint = read_new_records(temp_path, SampleRecord)
+        assert records == test_records[:1]
+        assert checkpoint.csv_header == ["a", "b", "s", "x", "y"]
+
+        # A quoted field spanning lines is only read once it is complete
+        with temp_path.open("a", newline="") as f:
+            f.write('3,4,"multi\r\n')
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert records == []
+
+        with temp_path.open("a", newline="") as f:
+            f.write('line",1.0,2.0\r\n' + csv_rows[1])
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert [record.s for record in records] == ["multi\r\nline", "world"]
+
+
+def test_truncation_and_rotation():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "log.jsonl"
+        write_records_to_file(temp_path, test_records)
+        _, checkpoint = read_new_records(temp_path, SampleRecord)
+
+        # Truncated file
+        temp_path.write_text(record_lines[1])
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert records == test_records[1:]
+
+        # Rewritten in place with the same size
+        temp_path.write_text(record_lines[1].replace("world", "earth"))
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert [record.s for record in records] == ["earth"]
+
+        # Rotated file
+        temp_path.rename(temp_path.with_suffix(".1"))
+        temp_path.write_text(record_lines[0])
+        records, checkpoint = read_new_records(temp_path, SampleRecord, checkpoint)
+        assert records == test_records[:1]
+
+
+def test_follow_records():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "log.jsonl"
+        temp_path.write_text(record_lines[0])
+
+        follower = follow_records(temp_path, SampleRecord, poll_interval=0.01)
+        records, _ = next(follower)
+        assert records == test_records[:1]
+
+        with temp_path.open("a") as f:
+            f.write(record_lines[1])
+        records, checkpoint = next(follower)
+        assert records == test_records[1:]
+        assert checkpoint.offset == temp_path.stat().st_size
+
+
+def test_unsupported_format():
+    with raises(ValueError):
+        read_new_records("log.json", SampleRecord)
+
+
+def test_read_new_csv_records_with_bare_quotes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "log.csv"
+        temp_path.write_bytes(b'a,s\r\n1,5" screen\r\n2,ok\r\n')
+
+        records, checkpoint = read_new_records(temp_path, Item)
+        assert records == [Item(a=1, s='5" screen'), Item(a=2, s="ok")]
+        assert checkpoint.offset == temp_path.stat().st_size
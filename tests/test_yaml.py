@@ -41,3 +41,16 @@ def test_write_list_of_records_to_writer():
     writer = BytesIO()
     write_records_to_writer(writer, test_records, "yaml")
     assert writer.getvalue() == data
+
+
+def test_write_records_from_generator_to_writer():
+    data = yaml.safe_dump([record.model_dump(mode="json") for record in test_records]).encode(
+        "utf-8"
+    )
+    writer = BytesIO()
+    write_records_to_writer(writer, (record for record in test_records), "yaml")
+    assert writer.getvalue() == data
+
+    writer = BytesIO()
+    write_records_to_writer(writer, iter([]), "yaml")
+    assert writer.getvalue() == yaml.safe_dump([]).encode("utf-8")